@@ -1,93 +1,255 @@
 import re
 import sys
 import os
-import requests
-from requests.auth import HTTPBasicAuth
-from typing import Any, List, Optional, Dict
-from subprocess import check_output
+import json
+from hashlib import sha256
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Optional, Dict, Sequence, Tuple
 
+if TYPE_CHECKING:
+    import http.client
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional, fall back to the standard library parser
+    from json import loads as json_loads
+
+PROJECT_KEY = "CCDP1"
+
+# Define allowed transitions
+_ALLOWED_TRANSITIONS = frozenset(
+    {
+        "to_do",
+        "testing_done",
+        "staging_deployed",
+        "staging_approved",
+        "review",
+        "production_deployed",
+        "done",
+        "peer_review",
+        "in_progress",
+    }
+)
+
+# Jira credentials and endpoint are constant for the whole run
+_JIRA_EMAIL = os.getenv("JIRA_EMAIL")
+_JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
+_JIRA_HOST = "customerlabs.atlassian.net"
+_JIRA_ISSUE_PATH = "/rest/api/3/issue/"
+
+# Only the issue fields validate_issue reads (700 is start date, 751 is completed at)
+_JIRA_ISSUE_QUERY = "?fields=issuetype,subtasks,customfield_10700,customfield_10751"
+
+# Parsed commands of the last composed message, stored in the git directory
+_PARSE_CACHE_FILENAME = "clabs_smart_commit_cache.json"
+
+# Fallback for reading the current branch when HEAD can't be read directly
+_GIT_BRANCH_CMD = ("git", "symbolic-ref", "--short", "HEAD")
+
+# Branches that can't be committed to directly
+_RESTRICTED_BRANCHES = frozenset({"master", "main"})
+_RESTRICTED_BRANCH_PREFIXES = ("staging", "production")
+
+# Patterns are compiled once at import instead of on every call.
+_JIRA_KEY_RE = re.compile(rf"{PROJECT_KEY}-(\d+)", re.IGNORECASE)  # Case insensitive
+
+# #time and '#' followed by word characters (#comment and transitions) are matched
+# in a single pass. Tags are captured in a lookahead so the scan continues over
+# their text, e.g. a transition written after the comment.
+_JIRA_COMMAND_RE = re.compile(
+    # Time components only. Possessive quantifiers never give back what they
+    # matched, so a long malformed #time value can't make the match backtrack.
+    # The first component needs the unit right after the number, e.g. "2h 30m".
+    r"#time\s++(?P<time>\d++[hdm](?:\s++\d++\s*+[hdm])*+)"
+    r"|#(?=(?P<tag>\w+))"
+)
+_COMMENT_FALLBACK_RE = re.compile(r"#time\s+\S+\s*|#\w+")
+
+_INVALID_TIME_ERROR = "Error: Invalid or missing time format. Expected formats: 2d, 30m, 1h, 2h 30m ,etc."
+
+
+def run_command(command: Sequence[str]) -> Any:
+    """Runs any command, given as an argument list, and returns its output."""
+    # Only needed when HEAD can't be read directly, so keep it off the import path
+    from subprocess import check_output
 
-def run_command(command: str) -> Any:
-    """Runs any command and returns its output."""
     try:
-        stdout: str = check_output(command.split()).decode("utf-8").strip()
+        stdout: str = check_output(command, encoding="utf-8").strip()
     except Exception:
         stdout = ""
     return stdout
 
 
+@lru_cache(maxsize=1)
+def get_git_dir() -> str:
+    """Return the path of the git directory for the current working tree."""
+    git_dir = os.getenv("GIT_DIR", ".git")
+
+    # In worktrees and submodules .git is a file pointing at the real git directory
+    if os.path.isfile(git_dir):
+        with open(git_dir, "r") as f:
+            gitdir_line = f.readline().strip()
+        if gitdir_line.startswith("gitdir:"):
+            git_dir = os.path.join(os.path.dirname(git_dir), gitdir_line[len("gitdir:") :].strip())
+
+    return git_dir
+
+
+@lru_cache(maxsize=1)
 def get_branch() -> str:
-    return run_command("git symbolic-ref --short HEAD")
+    """Return the current branch, read from HEAD directly to avoid spawning git."""
+    git_dir = get_git_dir()
+
+    # The reftable backend keeps refs outside HEAD, which only holds a ".invalid" stub
+    if os.path.exists(os.path.join(git_dir, "reftable")):
+        return run_command(_GIT_BRANCH_CMD)
+
+    try:
+        with open(os.path.join(git_dir, "HEAD"), "r") as f:
+            head = f.read().strip()
+    except OSError:
+        return run_command(_GIT_BRANCH_CMD)
+
+    # A detached HEAD has no branch, same as `git symbolic-ref` failing
+    branch_prefix = "ref: refs/heads/"
+    if not head.startswith(branch_prefix):
+        return ""
+
+    branch = head[len(branch_prefix) :]
+    return run_command(_GIT_BRANCH_CMD) if branch == ".invalid" else branch
 
 
 def extract_jira_issue_key(message: str) -> Optional[str]:
     """Extract the Jira issue key from a given string."""
-    project_key = r"CCDP1"
-    match = re.search(
-        rf"{project_key}-(\d+)", message, re.IGNORECASE
-    )  # Case insensitive
+    match = _JIRA_KEY_RE.search(message)
     return match.group(0).upper() if match else None
 
 
 def extract_jira_commands(commit_msg: str) -> Dict[str, Optional[str]]:
-    """Extract Jira commands from the commit message."""
-    jira_issue_key = extract_jira_issue_key(commit_msg)
-    time = extract_and_validate_time(commit_msg)
-    comment = extract_comment(commit_msg, time)
-    transition = extract_transition(commit_msg, jira_issue_key)
+    """Extract Jira commands from the commit message and check the issue in Jira.
+
+    Args:
+        commit_msg (str): The full commit message.
+
+    Raises:
+        ValueError: Raised if commit_msg has invalid time format
+
+    Returns:
+        Dict[str, Optional[str]]: The issue key, time spent, comment and transition.
+    """
+    issue_key, time_spent, comment, transition = parse_commit(commit_msg)
+
+    # Only moving an issue to done has preconditions to check, so skip the Jira request otherwise
+    if issue_key and transition == "done":
+        validate_issue(issue_key)
 
     return {
-        "issue_key": jira_issue_key,
-        "time": time,
+        "issue_key": issue_key,
+        "time": time_spent,
         "comment": comment,
         "transition": transition,
     }
 
 
-def extract_comment(commit_msg: str, time_spent: Optional[str]) -> Optional[str]:
-    """Extract the comment from the commit message.
+@lru_cache(maxsize=16)
+def parse_commit(
+    commit_msg: str,
+) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """Tokenize the commit message into Jira commands in a single pass.
+
+    Results are memoized, so parsing the same message again is free.
 
     Args:
         commit_msg (str): The full commit message.
-        time_spent (Optional[str]): The extracted time spent value.
+
+    Raises:
+        ValueError: Raised if commit_msg has invalid time format
 
     Returns:
-        Optional[str]: The comment if present, or fallback to the message after time spent.
+        Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]: The issue key,
+            time spent, comment and transition.
     """
-    # First check if #comment is explicitly provided
-    comment_match = re.search(r"#comment\s+(.+)", commit_msg)
-    if comment_match:
-        return comment_match.group(1).strip()
+    # Without a '#' there can't be a #time command, so skip the scans entirely
+    if "#" not in commit_msg:
+        raise ValueError(_INVALID_TIME_ERROR)
+
+    issue_key = extract_jira_issue_key(commit_msg)
+    time_spent: Optional[str] = None
+    comment: Optional[str] = None
+    transition: Optional[str] = None
+
+    # The first match of each command wins
+    for match in _JIRA_COMMAND_RE.finditer(commit_msg):
+        command = match.lastgroup
+        if command == "time":
+            if time_spent is None:
+                time_spent = match.group(command)
+        else:
+            tag = match.group(command)
+            if tag == "comment":
+                if comment is None:
+                    comment = extract_comment(commit_msg, match.end(command))
+            elif transition is None:
+                state = tag.lower()
+                if state in _ALLOWED_TRANSITIONS:
+                    transition = state
+
+        # Stop as soon as every command is found instead of scanning the rest of the body
+        if time_spent and comment is not None and transition:
+            break
+
+    # The time group of _JIRA_COMMAND_RE only matches the smart commit time format,
+    # which is what is_valid_time_format used to check
+    if not time_spent:
+        raise ValueError(_INVALID_TIME_ERROR)
 
     # Fallback to everything after #time or issue key if #comment isn't present
-    comment_part = re.split(r"#time\s+\S+\s*|#\w+", commit_msg)[-1].strip()
-    return comment_part if comment_part else None
+    # (only the text after the last command is needed, so don't split the whole message)
+    if comment is None:
+        comment_start = 0
+        for match in _COMMENT_FALLBACK_RE.finditer(commit_msg):
+            comment_start = match.end()
+        comment = commit_msg[comment_start:].strip() or None
 
+    return issue_key, time_spent, comment, transition
 
-def extract_and_validate_time(commit_msg: str) -> Optional[str]:
-    """Extract time and validates the format
 
-    Args:
-        commit_msg (str): Commit message to extract time from
+def extract_comment(commit_msg: str, start: int) -> Optional[str]:
+    """Extract the comment given with #comment.
 
-    Raises:
-        ValueError: Raised if commit_msg has invalid time format
+    Args:
+        commit_msg (str): The full commit message.
+        start (int): Index right after the #comment command.
 
     Returns:
-        Optional[str]: Time spent
+        Optional[str]: The text up to the end of its line or the next command, or None if
+            #comment isn't followed by comment text.
     """
-
-    time_match = re.search(
-        r"#time\s+(\d+\s*[hdm](?:\s+\d+\s*[hdm])*)", commit_msg
-    )  # Get time components only
-    time_spent = time_match.group(1) if time_match else None
-
-    if not time_spent or not is_valid_time_format(time_spent):
-        raise ValueError(
-            "Error: Invalid or missing time format. Expected formats: 2d, 30m, 1h, 2h 30m ,etc."
-        )
-
-    return time_spent
+    msg_length = len(commit_msg)
+    comment_start = start
+    while comment_start < msg_length and commit_msg[comment_start].isspace():
+        comment_start += 1
+    if comment_start == start:
+        return None
+
+    comment_end = commit_msg.find("\n", comment_start)
+    if comment_end < 0:
+        comment_end = msg_length
+
+    # Stop before the next command, e.g. the transition in "#comment Fixed it #done".
+    # Other hashtags such as "#45" are part of the comment.
+    for match in _JIRA_COMMAND_RE.finditer(commit_msg, comment_start, comment_end):
+        command_start = match.start()
+        if command_start > comment_start and not commit_msg[command_start - 1].isspace():
+            continue
+        command = match.lastgroup
+        tag = match.group(command)
+        if command == "time" or tag == "comment" or tag.lower() in _ALLOWED_TRANSITIONS:
+            comment_end = command_start
+            break
+
+    # A command right after #comment means there's no comment text, use the fallback instead
+    return commit_msg[comment_start:comment_end].strip() or None
 
 
 def normalize_transition(transition: str) -> str:
@@ -95,59 +257,82 @@ def normalize_transition(transition: str) -> str:
     return transition.lower().replace(" ", "_")
 
 
-def extract_transition(commit_msg: str, issue_key: str) -> Optional[str]:
-    """Extract the transition action from the commit message.
+@lru_cache(maxsize=1)
+def get_jira_connection() -> "http.client.HTTPSConnection":
+    """Return a connection to Jira, opened once and reused for every request."""
+    # Only needed when Jira is queried, so keep it off the import path
+    import http.client
+    import ssl
+
+    # Verify Jira's certificate against certifi's CA bundle, like requests did, so
+    # interpreters without a configured system CA store still work
+    try:
+        import certifi
+
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+    except ImportError:
+        ssl_context = ssl.create_default_context()
+
+    return http.client.HTTPSConnection(_JIRA_HOST, timeout=5, context=ssl_context)
+
+
+@lru_cache(maxsize=1)
+def get_jira_headers() -> Dict[str, str]:
+    """Return the headers for Jira requests, with basic auth from the Jira credentials."""
+    from base64 import b64encode
+
+    credentials = b64encode(f"{_JIRA_EMAIL}:{_JIRA_API_TOKEN}".encode("utf-8")).decode("ascii")
+    return {"Accept": "application/json", "Authorization": f"Basic {credentials}"}
+
+
+def fetch_jira_issue(issue_key: str) -> Tuple[int, bytes]:
+    """Fetch the issue fields validate_issue reads, retrying once on a connection error.
 
     Args:
-        commit_msg (str): The full commit message.
         issue_key (str): The extracted issue key.
 
     Returns:
-        Optional[str]: The transition action if present.
+        Tuple[int, bytes]: The response status and body.
     """
-    # Define allowed transitions
-    allowed_transitions = [
-        "to_do",
-        "testing_done",
-        "staging_deployed",
-        "staging_approved",
-        "review",
-        "production_deployed",
-        "done",
-        "peer_review",
-        "in_progress",
-    ]
+    connection = get_jira_connection()
+    path = _JIRA_ISSUE_PATH + issue_key + _JIRA_ISSUE_QUERY
 
-    jira_email = os.getenv("JIRA_EMAIL")
-    jira_api_token = os.getenv("JIRA_API_TOKEN")
+    try:
+        connection.request("GET", path, headers=get_jira_headers())
+        response = connection.getresponse()
+    except OSError:  # Includes http.client.RemoteDisconnected and timeouts
+        # Closing resets the connection so the retry opens a fresh one
+        connection.close()
+        connection.request("GET", path, headers=get_jira_headers())
+        response = connection.getresponse()
 
-    # Get issue details
-    url = f"https://customerlabs.atlassian.net/rest/api/3/issue/{issue_key}"
+    return response.status, response.read()
 
-    auth = HTTPBasicAuth(jira_email, jira_api_token)
 
-    headers = {"Accept": "application/json"}
+def validate_issue(issue_key: str) -> None:
+    """Check that the Jira issue is ready to be moved to done, exiting if it isn't.
 
-    response = requests.request("GET", url, headers=headers, auth=auth)
+    Args:
+        issue_key (str): The extracted issue key.
+    """
+    # Get issue details
+    status, response_body = fetch_jira_issue(issue_key)
 
-    if response.status_code != 200:
-        print(f"Error: Failed to fetch issue details. {response.json().get('errorMessages')}")
+    if status != 200:
+        print(f"Error: Failed to fetch issue details. {json_loads(response_body).get('errorMessages')}")
         sys.exit(1)
 
-    issue_data = response.json()
-
-    incomplete_issues: List[str] = []
+    issue_data = json_loads(response_body)
 
     # Check if the issue is a parent task
     is_subtask = issue_data["fields"]["issuetype"]["subtask"]
-    if not is_subtask and len(issue_data["fields"]["subtasks"]) > 0:
+    if not is_subtask:
         # Check the status of all subtasks
-        for subtask in issue_data["fields"]["subtasks"]:
-            subtask_key = subtask["key"]
-            subtask_status = subtask["fields"]["status"]["statusCategory"]["key"]
-
-            if subtask_status != "done":
-                incomplete_issues.append(subtask_key)
+        incomplete_issues: List[str] = [
+            subtask["key"]
+            for subtask in issue_data["fields"]["subtasks"]
+            if subtask["fields"]["status"]["statusCategory"]["key"] != "done"
+        ]
 
         if incomplete_issues:
             print(
@@ -155,8 +340,7 @@ def extract_transition(commit_msg: str, issue_key: str) -> Optional[str]:
             )
             sys.exit(1)  # Block the transition if any subtasks are not done
 
-    # If it's not a subtask, check if start date and end date are present
-    if not is_subtask:
+        # Check if start date and end date are present
         if not issue_data["fields"].get("customfield_10700"):  # 700 is start date
             print("Start date not set. Please update start date for the parent task and try again.")
             sys.exit(1)  # Block the transition if start date is not set
@@ -165,35 +349,6 @@ def extract_transition(commit_msg: str, issue_key: str) -> Optional[str]:
             print("End date not set. Please update end date for the parent task and try again.")
             sys.exit(1)  # Block the transition if end date is not set
 
-    states = re.findall(r"#(\w+)", commit_msg, re.IGNORECASE)  # Matches '# followed by one or more word characters'
-    states = list(map(str.lower, states))
-
-    # Return the first match that is in allowed transitions
-    for state in states:
-        if state in allowed_transitions:
-            return state
-
-    return None
-
-
-    states = re.findall(
-        r"#(\w+)", commit_msg, re.IGNORECASE
-    )  # Matches '# followed by one or more word characters'
-    states = list(map(str.lower, states))
-
-    # Return the first match that is in allowed transitions
-    for state in states:
-        if state in allowed_transitions:
-            return state
-
-    return None
-
-
-def is_valid_time_format(time_str: str) -> bool:
-    """Check if the time format is valid according to smart commit standards."""
-    pattern = r"^\d+[hdm]"
-    return bool(re.match(pattern, time_str))
-
 
 def compose_smart_commit_message(
     issue_key: str,
@@ -213,29 +368,93 @@ def compose_smart_commit_message(
         str: Composed smart commit message.
     """
 
-    base_message = f"{issue_key} #time {time}"
-    if comment:
-        base_message += f" #comment {comment}"
-    if transition:
-        base_message += f" #{transition}"
-    return base_message
+    return f"{issue_key} #time {time}{' #comment ' + comment if comment else ''}{' #' + transition if transition else ''}"
+
+
+def read_commit_msg(fd: int) -> str:
+    """Read the commit message from an open file descriptor, skipping the buffered file object."""
+    # Commit messages almost always fit in the first read
+    chunks: List[bytes] = []
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    return b"".join(chunks).decode("utf-8")
+
+
+def write_commit_msg(fd: int, message: str) -> None:
+    """Replace the contents of the commit message file through the same file descriptor."""
+    data = message.encode("utf-8")
+    os.ftruncate(fd, 0)
+    written = 0
+    while written < len(data):
+        written += os.pwrite(fd, data[written:], written)
+
+
+def get_parse_cache_key(filepath: str) -> List[Any]:
+    """Identify a commit message file by its path, modification time and size."""
+    stat = os.stat(filepath)
+    return [os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size]
+
+
+def load_cached_commands(filepath: str) -> Optional[Dict[str, Optional[str]]]:
+    """Return the cached Jira commands if the commit message file hasn't changed since it was composed.
+
+    Args:
+        filepath (str): Path of the commit message file.
+
+    Returns:
+        Optional[Dict[str, Optional[str]]]: The cached commands, or None if there's no valid cache entry.
+    """
+    try:
+        with open(os.path.join(get_git_dir(), _PARSE_CACHE_FILENAME), "r") as f:
+            cache = json.load(f)
+        if cache["key"] != get_parse_cache_key(filepath):
+            return None
+
+        # mtime can be too coarse to notice a same-length rewrite, so compare the contents too
+        with open(filepath, "rb") as f:
+            if sha256(f.read()).hexdigest() == cache["message_sha256"]:
+                return cache["jira_commands"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # A missing or unreadable cache just means parsing again
+    return None
+
+
+def save_cached_commands(
+    filepath: str, message: str, jira_commands: Dict[str, Optional[str]]
+) -> None:
+    """Cache the Jira commands for the commit message file as it is now.
+
+    Args:
+        filepath (str): Path of the commit message file.
+        message (str): The composed message written to the file.
+        jira_commands (Dict[str, Optional[str]]): The commands the message was composed from.
+    """
+    try:
+        with open(os.path.join(get_git_dir(), _PARSE_CACHE_FILENAME), "w") as f:
+            json.dump(
+                {
+                    "key": get_parse_cache_key(filepath),
+                    "message_sha256": sha256(message.encode("utf-8")).hexdigest(),
+                    "jira_commands": jira_commands,
+                },
+                f,
+            )
+    except OSError:
+        pass
 
 
 def main() -> None:
 
     # Check if API key and email ids are present for JIRA
 
-    jira_email = os.getenv("JIRA_EMAIL")
-    jira_api_token = os.getenv("JIRA_API_TOKEN")
-
-    if not jira_email:
+    if not _JIRA_EMAIL:
         print(
             "Error: JIRA_EMAIL environment variable is not set.\n"
             "Please set your JIRA email ID in .bashrc or .zshrc \n"
         )
         sys.exit(1)
 
-    if not jira_api_token:
+    if not _JIRA_API_TOKEN:
         print(
             "Error: JIRA_API_TOKEN environment variable is not set.\n"
             "Visit the following link to generate an API token:\n"
@@ -247,53 +466,66 @@ def main() -> None:
     # Commit message file path from arguments
     commit_msg_filepath = sys.argv[1]
 
-    branch = get_branch()
+    # CI can provide the branch up front, which avoids looking it up in git
+    branch = os.getenv("PRE_COMMIT_BRANCH") or get_branch()
 
-    if branch in ["master", "main"] or branch.startswith(("staging", "production")):
+    if branch in _RESTRICTED_BRANCHES or branch.startswith(_RESTRICTED_BRANCH_PREFIXES):
         print(
             f"Error: You're trying to commit directly to a restricted branch. Pushes to {branch} is prohibited. Please commit to a feature branch and open a PR"
         )
         sys.exit(1)
 
     try:
-        with open(commit_msg_filepath, "r") as f:
-            commit_msg = f.read()
-
-        # Extract Jira commands from commit message
-        jira_commands = extract_jira_commands(commit_msg)
-
-        if not jira_commands["issue_key"]:
-            print("Error: Jira issue key is mandatory in the commit message.")
-            sys.exit(1)
-
-        if not jira_commands["time"]:
-            print("Error: Time spent on issue is mandatory in the commit message.")
-            sys.exit(1)
-
-        if not jira_commands["comment"]:
-            print("Error: Comment is mandatory in the commit message.")
-            sys.exit(1)
-
-        if not jira_commands["transition"]:
-            print("Error: Transition action is mandatory in the commit message.")
-            sys.exit(1)
-
-        print(jira_commands)
+        # The hook runs for both prepare-commit-msg and commit-msg. If the message is
+        # still the one composed by the first run, it's already a valid smart commit.
+        cached_commands = load_cached_commands(commit_msg_filepath)
+        if cached_commands:
+            print(f"Smart commit message already composed: {cached_commands}")
+            return
+
+        # Read and rewrite the commit message through a single file descriptor
+        commit_msg_fd = os.open(commit_msg_filepath, os.O_RDWR)
+        try:
+            commit_msg = read_commit_msg(commit_msg_fd)
+
+            # Extract Jira commands from commit message
+            jira_commands = extract_jira_commands(commit_msg)
+
+            if not jira_commands["issue_key"]:
+                print("Error: Jira issue key is mandatory in the commit message.")
+                sys.exit(1)
+
+            if not jira_commands["time"]:
+                print("Error: Time spent on issue is mandatory in the commit message.")
+                sys.exit(1)
+
+            if not jira_commands["comment"]:
+                print("Error: Comment is mandatory in the commit message.")
+                sys.exit(1)
+
+            if not jira_commands["transition"]:
+                print("Error: Transition action is mandatory in the commit message.")
+                sys.exit(1)
+
+            # Compose the smart commit message
+            smart_commit_message = compose_smart_commit_message(
+                jira_commands["issue_key"],
+                jira_commands["time"],
+                jira_commands["comment"],
+                jira_commands["transition"],
+            )
 
-        # Compose the smart commit message
-        smart_commit_message = compose_smart_commit_message(
-            jira_commands["issue_key"],
-            jira_commands["time"],
-            jira_commands["comment"],
-            jira_commands["transition"],
-        )
+            # Output the extracted commands and composed message for confirmation in one write
+            sys.stdout.write(
+                f"{jira_commands}\nComposed smart commit message: {smart_commit_message}\n"
+            )
 
-        # Output the composed message for confirmation
-        print(f"Composed smart commit message: {smart_commit_message}")
+            # Override commit message with the formatted smart commit message
+            write_commit_msg(commit_msg_fd, smart_commit_message)
+        finally:
+            os.close(commit_msg_fd)
 
-        # Override commit message with the formatted smart commit message
-        with open(commit_msg_filepath, "w") as f:
-            f.write(smart_commit_message)
+        save_cached_commands(commit_msg_filepath, smart_commit_message, jira_commands)
 
     except ValueError as e:
         print(e)
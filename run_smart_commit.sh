@@ -1,3 +1,4 @@
 #!/bin/bash
-exec < /dev/tty  # Allow interactive shell commands
-poetry run python clabs_smart_commit.py "$@"
\ No newline at end of file
+# Allow interactive shell commands, only when stdin isn't already a terminal and one is available (not in CI)
+[ -t 0 ] || { exec < /dev/tty; } 2>/dev/null
+exec poetry run python clabs_smart_commit.py "$@"
\ No newline at end of file